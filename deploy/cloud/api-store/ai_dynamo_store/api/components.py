@@ -15,26 +15,34 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import re
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Union
 
 from fastapi import Query
-from pydantic import BaseModel, ValidationError, field_validator
+from pydantic import AfterValidator, BaseModel, ValidationError
 from sqlalchemy import JSON, Column
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlmodel import Field as SQLField
 from sqlmodel import SQLModel
 
+# "key:value" search tokens; the key stops at the first colon
+_Q_TOKEN = re.compile(r"([^\s:]*):(\S*)")
+
+
+def _utcnow_naive() -> datetime:
+    # datetime.utcnow() is deprecated as of Python 3.12
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 class TimeCreatedUpdated(SQLModel):
     created_at: datetime = SQLField(
-        default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        default_factory=_utcnow_naive,
         nullable=False,
     )
     updated_at: datetime = SQLField(
-        default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        default_factory=_utcnow_naive,
         nullable=False,
     )
 
@@ -92,15 +100,10 @@ class ListQuerySchema(BaseModel):
         if not self.q:
             return {}
 
-        query = defaultdict(list)
-        for piece in self.q.split():
-            if ":" in piece:
-                k, v = piece.split(":")
-                query[k].append(v)
-
-            else:
-                # Todo: add search keywords
-                continue
+        # Todo: add search keywords (pieces without a colon are ignored)
+        query: Dict[str, List[str]] = {}
+        for m in _Q_TOKEN.finditer(self.q):
+            query.setdefault(m.group(1), []).append(m.group(2))
 
         return query
 
@@ -178,6 +181,13 @@ def _validate_manifest(v):
         raise ValueError(f"Invalid manifest schema: {e}")
 
 
+# Shared by the API schema and the DB model so both reuse one validator definition
+ManifestField = Annotated[
+    Optional[Union[DynamoComponentVersionManifestSchema, Dict[str, Any]]],
+    AfterValidator(_validate_manifest),
+]
+
+
 class DynamoComponentVersionSchema(ResourceSchema):
     bento_repository_uid: str
     version: str
@@ -192,13 +202,9 @@ class DynamoComponentVersionSchema(ResourceSchema):
     presigned_urls_deprecated: bool = False
     transmission_strategy: TransmissionStrategy
     upload_id: str = ""
-    manifest: Optional[Union[DynamoComponentVersionManifestSchema, Dict[str, Any]]]
+    manifest: ManifestField
     build_at: datetime
 
-    @field_validator("manifest")
-    def validate_manifest(cls, v):
-        return _validate_manifest(v)
-
 
 class DynamoComponentVersionFullSchema(DynamoComponentVersionSchema):
     repository: DynamoComponentSchema
@@ -248,17 +254,11 @@ class DynamoComponentVersionBase(BaseDynamoComponentModel):
     upload_started_at: Optional[datetime] = SQLField(default=None)
     upload_finished_at: Optional[datetime] = SQLField(default=None)
     upload_finished_reason: str = SQLField(default="")
-    manifest: Optional[
-        Union[DynamoComponentVersionManifestSchema, Dict[str, Any]]
-    ] = SQLField(
+    manifest: ManifestField = SQLField(
         default=None, sa_column=Column(JSON)
     )  # JSON-like field for the manifest
     build_at: datetime = SQLField()
 
-    @field_validator("manifest")
-    def validate_manifest(cls, v):
-        return _validate_manifest(v)
-
 
 class DynamoComponentBase(BaseDynamoComponentModel):
     name: str = SQLField(default="", unique=True)
@@ -0,0 +1,32 @@
+#  SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#  #
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  #
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  #
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from ..api.components import ListQuerySchema
+
+
+def test_get_query_map():
+    assert ListQuerySchema(q="").get_query_map() == {}
+
+    query = ListQuerySchema(q="name:foo keyword label:a label:b").get_query_map()
+    assert query == {"name": ["foo"], "label": ["a", "b"]}
+
+    # Only the first colon separates key and value
+    query = ListQuerySchema(q="label:env:prod").get_query_map()
+    assert query == {"label": ["env:prod"]}
+
+    # Empty keys and values are kept, as with the previous split(":")
+    query = ListQuerySchema(q="label: :x").get_query_map()
+    assert query == {"label": [""], "": ["x"]}
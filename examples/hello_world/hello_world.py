@@ -75,18 +75,27 @@ class ResponseType(BaseModel):
 class Backend:
     def __init__(self) -> None:
         logger.info("Starting backend")
-        config = ServiceConfig.get_instance()
-        self.message = config.get("Backend", {}).get("message", "back")
+        config = ServiceConfig.get_instance().get("Backend", {})
+        self.message = config.get("message", "back")
+        # Number of tokens joined into each streamed response
+        self.yield_batch = max(1, int(config.get("yield_batch", 1)))
         logger.info(f"Backend config message: {self.message}")
 
     @endpoint()
     async def generate(self, req: RequestType):
         """Generate tokens."""
         req_text = req.text
-        logger.info(f"Backend received: {req_text}")
+        logger.info("Backend received: %s", req_text)
         text = f"{req_text}-{self.message}"
+        prefix = "Backend: "
+        batch = []
         for token in text.split():
-            yield f"Backend: {token}"
+            batch.append(prefix + token)
+            if len(batch) == self.yield_batch:
+                yield "\n".join(batch)
+                batch.clear()
+        if batch:
+            yield "\n".join(batch)
 
     @on_shutdown
     def shutdown(self):
@@ -102,20 +111,21 @@ class Middle:
 
     def __init__(self) -> None:
         logger.info("Starting middle")
-        config = ServiceConfig.get_instance()
-        self.message = config.get("Middle", {}).get("message", "mid")
+        config = ServiceConfig.get_instance().get("Middle", {})
+        self.message = config.get("message", "mid")
         logger.info(f"Middle config message: {self.message}")
 
     @endpoint()
     async def generate(self, req: RequestType):
         """Forward requests to backend."""
         req_text = req.text
-        logger.info(f"Middle received: {req_text}")
+        logger.info("Middle received: %s", req_text)
         text = f"{req_text}-{self.message}"
         next_request = RequestType(text=text).model_dump_json()
+        prefix = "Middle: "
         async for response in self.backend.generate(next_request):
-            logger.info(f"Middle received response: {response}")
-            yield f"Middle: {response}"
+            logger.info("Middle received response: %s", response)
+            yield prefix + response
 
     @on_shutdown
     def shutdown(self):
@@ -136,9 +146,9 @@ class Frontend:
         configure_dynamo_logging(service_name="Frontend")
 
         logger.info("Starting frontend")
-        config = ServiceConfig.get_instance()
-        self.message = config.get("Frontend", {}).get("message", "front")
-        self.port = config.get("Frontend", {}).get("port", 8000)
+        config = ServiceConfig.get_instance().get("Frontend", {})
+        self.message = config.get("message", "front")
+        self.port = config.get("port", 8000)
         logger.info(f"Frontend config message: {self.message}")
         logger.info(f"Frontend config port: {self.port}")
 
@@ -146,7 +156,7 @@ class Frontend:
     @api()
     async def generate(self, request: RequestType):
         """Stream results from the pipeline."""
-        logger.info(f"Frontend received: {request.text}")
+        logger.info("Frontend received: %s", request.text)
 
         async def content_generator():
             async for response in self.middle.generate(request.model_dump_json()):
@@ -44,6 +44,10 @@ EMBEDDINGS_SHAPE = (1, 577, 4096)
 EMBEDDINGS_DTYPE = torch.float16
 EMBEDDINGS_DEVICE = "cuda"
 
+# Token id of the image placeholder in the prompt.
+# TODO: make this more flexible/model-dependent
+IMAGE_TOKEN_ID = 32000
+
 
 class RequestType(BaseModel):
     text: str
@@ -87,9 +91,6 @@ class VllmPrefillWorker:
             )
             self.engine_args.enable_prefix_caching = False
 
-        signal.signal(signal.SIGTERM, self.shutdown_vllm_engine)
-        signal.signal(signal.SIGINT, self.shutdown_vllm_engine)
-
     @async_on_start
     async def async_init(self):
         self._engine_context = build_async_engine_client_from_engine_args(
@@ -139,18 +140,29 @@ class VllmPrefillWorker:
                 sys.exit(1)
 
         task.add_done_callback(prefill_queue_handler_cb)
+
+        # Set up signal handler for graceful shutdown
+        # TODO: move to dynamo sdk
+        loop = asyncio.get_running_loop()
+
+        def signal_handler():
+            # Schedule the shutdown coroutine instead of calling it directly
+            asyncio.create_task(self.graceful_shutdown(runtime))
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, signal_handler)
+
         logger.info("Initialization complete.")
 
-    def shutdown_vllm_engine(self, signum, frame):
-        """Shutdown the background loop"""
-        logger.info(f"Shutdown started, signal {signum} received.")
-        loop = asyncio.get_event_loop()
+    async def graceful_shutdown(self, runtime):
+        """Shutdown the vllm engine, then the DistributedRuntime"""
+        logger.info("Shutdown started.")
         try:
             self.engine_client.close()
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
         finally:
-            loop.stop()
+            runtime.shutdown()
         logger.info("Shutdown complete.")
 
     async def prefill_queue_handler(self):
@@ -177,7 +189,7 @@ class VllmPrefillWorker:
                 prefill_request = await prefill_queue.dequeue_prefill_request()
                 if prefill_request is not None:
                     logger.info(
-                        f"Dequeued prefill request: {prefill_request.request_id}"
+                        "Dequeued prefill request: %s", prefill_request.request_id
                     )
                     async for _ in self.generate(prefill_request):
                         pass
@@ -191,7 +203,9 @@ class VllmPrefillWorker:
         image_url = request.multimodal_data_source["image_url"]
 
         logger.info(
-            f"Received prefill request {{ id: {request_id}, engine_id: {engine_id} }}."
+            "Received prefill request { id: %s, engine_id: %s }.",
+            request_id,
+            engine_id,
         )
 
         # Extract the pre-allocated, reusable image embeddings tensor and its descriptor.
@@ -199,23 +213,30 @@ class VllmPrefillWorker:
         embeddings, descriptor = self._embeddings_descriptor
 
         # Create a new writable operation from the descriptor.
+        # Writable operations complete exactly once (one notification key each), so one is
+        # created per request; the descriptor registration and serialized metadata are cached.
         with self._connector.create_writable(descriptor) as writable:
             # Extract serialized metadata about the operation from the writable operation,
             # and use it to create a new EncodeRequest.
+            # All fields are produced locally, so skip validation and only serialize.
             encode_generator = await self.encode_worker_client.round_robin(
-                EncodeRequest(
+                EncodeRequest.model_construct(
                     request_id=request_id,
                     image_url=image_url,
                     serialized_request=writable.to_serialized(),
                 ).model_dump_json()
             )
+            # The responses only signal progress; the embeddings arrive through NIXL.
+            # Only parse them when they are going to be logged.
+            log_responses = logger.isEnabledFor(logging.DEBUG)
             async for encode_response in encode_generator:
-                encode_output = EncodeResponse.model_validate_json(
-                    encode_response.data(),
-                )
-                logger.debug(
-                    f"Received response: {{ id: {encode_output.request_id} }}."
-                )
+                if log_responses:
+                    encode_output = EncodeResponse.model_validate_json(
+                        encode_response.data(),
+                    )
+                    logger.debug(
+                        "Received response: { id: %s }.", encode_output.request_id
+                    )
 
             # Wait for the write operation to complete.
             # This will block until the write operation is complete.
@@ -240,23 +261,22 @@ class VllmPrefillWorker:
                 remote_metadata = await self._metadata_store.get(request.engine_id)
                 await self.engine_client.add_remote_nixl_metadata(remote_metadata)
                 logger.info(
-                    f"Loaded nixl metadata from engine {engine_id} into "
-                    f"engine {self.engine_client.nixl_metadata.engine_id}"
+                    "Loaded nixl metadata from engine %s into engine %s",
+                    engine_id,
+                    self.engine_client.nixl_metadata.engine_id,
                 )
                 self._loaded_metadata.add(engine_id)
 
             # To make sure the decode worker can pre-allocate the memory with the correct size for the prefill worker to transfer the kv cache,
             # some placeholder dummy tokens are inserted based on the embedding size in the worker.py.
-            # TODO: make this more flexible/model-dependent
-            IMAGE_TOKEN_ID = 32000
             embedding_size = embeddings.shape[1]
             padding_size = embedding_size - 1
-            image_token_index = request.prompt_token_ids.index(IMAGE_TOKEN_ID)
+            src = request.prompt_token_ids
+            image_token_index = src.index(IMAGE_TOKEN_ID)
             dummy_token_index = image_token_index + 1
-            prompt_token_ids = (
-                request.prompt_token_ids[:dummy_token_index]
-                + request.prompt_token_ids[dummy_token_index + padding_size :]
-            )
+            # Extend the head slice in place rather than concatenating two slices.
+            prompt_token_ids = src[:dummy_token_index]
+            prompt_token_ids.extend(src[dummy_token_index + padding_size :])
 
             async for _ in self.engine_client.generate(
                 request_id=request_id,
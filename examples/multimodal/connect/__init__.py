@@ -438,6 +438,7 @@ class Connector:
         self._nixl = nixl_api.nixl_agent(self._worker_id)
         self._hostname = socket.gethostname()
         self._agent_metadata: Optional[bytes] = None
+        self._compressed_metadata: Optional[str] = None
 
         logger.debug(f"Created {self.__repr__()}.")
 
@@ -472,6 +473,26 @@ class Connector:
         """
         return self._nixl.get_agent_metadata()
 
+    def _get_compressed_metadata(self) -> str:
+        """
+        Gets the zlib compressed, hex encoded metadata of the worker.
+        The compressed form is cached and only recomputed when the NIXL agent metadata changes,
+        i.e. when new memory has been registered, avoiding compression on every operation.
+        """
+        metadata = self.metadata
+        if self._compressed_metadata is None or metadata != self._agent_metadata:
+            original_len = len(metadata)
+            compressed = zlib.compress(metadata, level=6)
+            compressed_len = len(compressed)
+            logger.debug(f"Compressed NIXL metadata from {original_len} bytes to {compressed_len} bytes.")
+            if compressed_len > original_len:
+                logger.warning(f"Compressed NIXL metadata is larger than original ({compressed_len} > {original_len}).")
+
+            self._agent_metadata = metadata
+            self._compressed_metadata = compressed.hex()
+
+        return self._compressed_metadata
+
     @property
     def name(self) -> str | None:
         """
@@ -1050,17 +1071,9 @@ class PassiveOperation(AbstractOperation):
             else:
                 descriptors = [self._local_descriptors.to_serialized()]
 
-            original_len = len(self._connector.metadata)
-            nixl_metadata = self._connector.metadata
-            nixl_metadata = zlib.compress(nixl_metadata, level=6)
-            compressed_len = len(nixl_metadata)
-            logger.debug(f"Compressed NIXL metadata from {original_len} bytes to {compressed_len} bytes.")
-            if compressed_len > original_len:
-                logger.warning(f"Compressed NIXL metadata is larger than original ({compressed_len} > {original_len}).")
-
             self._serialized_request = SerializedRequest(
                 descriptors=descriptors,
-                nixl_metadata=nixl_metadata.hex(),
+                nixl_metadata=self._connector._get_compressed_metadata(),
                 notification_key=self._notification_key,
                 operation_kind=int(self._operation_kind),
             )
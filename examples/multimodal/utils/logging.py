@@ -25,6 +25,9 @@ async def check_required_workers(
     workers_client: Client, required_workers: int, on_change=True, poll_interval=0.5
 ):
     """Wait until the minimum number of workers are ready."""
+    # Block on the client's instance watch for the first worker instead of polling.
+    if required_workers > 0 and not workers_client.instance_ids():
+        await workers_client.wait_for_instances()
     worker_ids = workers_client.instance_ids()
     num_workers = len(worker_ids)
 
@@ -15,9 +15,13 @@
 
 
 import asyncio
+import copy
+import gc
+import itertools
 import logging
 import os
 import signal
+import time
 import uuid
 
 from components.disagg_router import PyDisaggregatedRouter
@@ -39,6 +43,9 @@ from dynamo.sdk import async_on_start, depends, dynamo_context, endpoint, servic
 
 logger = logging.getLogger(__name__)
 
+# How long a prefill queue size read is reused for disaggregated routing decisions
+PREFILL_QUEUE_SIZE_TTL = 0.02
+
 
 @service(
     dynamo={
@@ -92,11 +99,17 @@ class VllmWorker:
 
         self.metrics_publisher = WorkerMetricsPublisher()
 
+        # Request ids are a per-worker random prefix plus a counter, so uuid4 is
+        # only generated once instead of on every request.
+        self._request_id_prefix = uuid.uuid4().hex
+        self._request_counter = itertools.count()
+
         model_config = self.engine_args.create_model_config()
         self.default_sampling_params = model_config.get_diff_sampling_param()
-
-        signal.signal(signal.SIGTERM, self.shutdown_vllm_engine)
-        signal.signal(signal.SIGINT, self.shutdown_vllm_engine)
+        # Built once and shallow-copied per request instead of re-running
+        # SamplingParams construction and argument verification each time
+        self._sampling_params_template = SamplingParams(**self.default_sampling_params)
+        self._sampling_params_template.output_kind = RequestOutputKind.DELTA
 
     @async_on_start
     async def async_init(self):
@@ -138,7 +151,28 @@ class VllmWorker:
 
         runtime = dynamo_context["runtime"]
 
+        # One long-lived NATS handle for remote prefill enqueues and queue size checks
+        self._prefill_queue = None
         if self.engine_args.remote_prefill:
+            self._prefill_queue = PrefillQueue(
+                stream_name=self._prefill_queue_stream_name,
+                nats_server=self._prefill_queue_nats_server,
+            )
+            await self._prefill_queue.connect()
+
+            # The engine awaits the callback for each remote prefill request in turn,
+            # so the callback only hands requests to a single NATS enqueue task.
+            max_num_seqs = self.engine_args.max_num_seqs or 256
+            self._remote_prefill_requests: asyncio.Queue[
+                RemotePrefillRequest
+            ] = asyncio.Queue(maxsize=max_num_seqs * 4)
+            self._remote_prefill_task = asyncio.create_task(
+                self.remote_prefill_request_pump()
+            )
+            self._remote_prefill_task.add_done_callback(
+                lambda _: logger.info("remote prefill request pump exited")
+            )
+
             metadata = self.engine_client.nixl_metadata
             metadata_store = NixlMetadataStore("dynamo", runtime)
             await metadata_store.put(metadata.engine_id, metadata)
@@ -154,6 +188,12 @@ class VllmWorker:
         else:
             self.disaggregated_router = None
 
+        if self.engine_args.remote_prefill and self.disaggregated_router is not None:
+            # Cached prefill queue size, only consulted by the disaggregated router
+            self._prefill_queue_size = 0
+            self._prefill_queue_size_time = float("-inf")
+            self._prefill_queue_size_lock = asyncio.Lock()
+
         # Set up signal handler for graceful shutdown
         # TODO: move to dynamo sdk
         loop = asyncio.get_running_loop()
@@ -165,24 +205,27 @@ class VllmWorker:
         for sig in (signal.SIGTERM, signal.SIGINT):
             loop.add_signal_handler(sig, signal_handler)
 
+        # Free startup garbage, then keep long-lived startup objects out of GC scans
+        gc.collect()
+        gc.freeze()
+
         logger.info("VllmWorker has been initialized")
 
     async def graceful_shutdown(self, runtime):
-        logger.info("Received shutdown signal, shutting down DistributedRuntime")
-        runtime.shutdown()
-        logger.info("DistributedRuntime shutdown complete")
-
-    def shutdown_vllm_engine(self, signum, frame):
-        """Shutdown the background loop"""
-        logger.info(f"Received signal {signum}, shutting down")
-        loop = asyncio.get_event_loop()
+        logger.info("Received shutdown signal, shutting down vllm engine")
         try:
+            if self.engine_args.remote_prefill:
+                self._remote_prefill_task.cancel()
+            if self._prefill_queue is not None:
+                await self._prefill_queue.close()
             self.engine_client.close()
             logger.info("VllmWorker shutdown complete")
         except Exception as e:
             logger.error(f"Error during shutdown: {e}")
         finally:
-            loop.stop()
+            logger.info("Shutting down DistributedRuntime")
+            runtime.shutdown()
+            logger.info("DistributedRuntime shutdown complete")
 
     async def create_metrics_publisher_endpoint(self):
         component = dynamo_context["component"]
@@ -191,25 +234,49 @@ class VllmWorker:
 
     def get_remote_prefill_request_callback(self):
         # TODO: integrate prefill_queue to dynamo endpoint
-        async def callback(request: RemotePrefillRequest):
-            async with PrefillQueue.get_instance(
-                nats_server=self._prefill_queue_nats_server,
-                stream_name=self._prefill_queue_stream_name,
-            ) as prefill_queue:
-                await prefill_queue.enqueue_prefill_request(request)
-
-        return callback
+        return self.submit_remote_prefill_request
+
+    async def submit_remote_prefill_request(self, request: RemotePrefillRequest):
+        # Only waits when the queue is full, which applies backpressure to the engine
+        await self._remote_prefill_requests.put(request)
+
+    async def remote_prefill_request_pump(self):
+        while True:
+            request = await self._remote_prefill_requests.get()
+            try:
+                await self._prefill_queue.enqueue_prefill_request(request)
+            except Exception as e:
+                logger.error(
+                    "Failed to enqueue remote prefill request %s: %s",
+                    request.request_id,
+                    e,
+                )
+                # Fail the request rather than leave it waiting on a prefill that never comes
+                await self.engine_client.abort(request.request_id)
+
+    async def get_prefill_queue_size(self) -> int:
+        """Prefill queue size, shared by all requests within PREFILL_QUEUE_SIZE_TTL"""
+        if time.monotonic() - self._prefill_queue_size_time < PREFILL_QUEUE_SIZE_TTL:
+            return self._prefill_queue_size
+        async with self._prefill_queue_size_lock:
+            # Another request may have refreshed the value while we waited on the lock
+            if (
+                time.monotonic() - self._prefill_queue_size_time
+                >= PREFILL_QUEUE_SIZE_TTL
+            ):
+                self._prefill_queue_size = await self._prefill_queue.get_queue_size()
+                self._prefill_queue_size_time = time.monotonic()
+        return self._prefill_queue_size
 
     @endpoint()
     async def generate(self, request: PreprocessedRequest):
-        request_id = str(uuid.uuid4())
+        request_id = f"{self._request_id_prefix}-{next(self._request_counter):x}"
 
-        if self.disaggregated_router is not None:
-            async with PrefillQueue.get_instance(
-                nats_server=self._prefill_queue_nats_server,
-                stream_name=self._prefill_queue_stream_name,
-            ) as prefill_queue:
-                prefill_queue_size = await prefill_queue.get_queue_size()
+        if not self.do_remote_prefill:
+            # the router decision would be ignored, skip the queue size lookup
+            disagg_router_decision = False
+        elif self.disaggregated_router is not None:
+            prefill_queue_size = await self.get_prefill_queue_size()
             disagg_router_decision = await self.disaggregated_router.prefill_remote(
                 len(request.token_ids),
                 (request.estimated_prefix_hit_num_blocks or 0)
@@ -220,22 +287,28 @@ class VllmWorker:
             # always prefill remotely if no disaggregated router is provided
             disagg_router_decision = True
 
-        if self.do_remote_prefill and disagg_router_decision:
+        if disagg_router_decision:
+            # A new RemotePrefillParams is needed per request: the engine client
+            # takes the callback out of the object it is given.
             remote_prefill_params = RemotePrefillParams(
                 is_remote_prefill=True,
                 remote_prefill_request_callback=self.get_remote_prefill_request_callback(),
             )
-            logger.info(
-                f"Prefilling remotely for request {request_id} with length {len(request.token_ids)} (estimated prefix hit length {(request.estimated_prefix_hit_num_blocks or 0) * self.engine_args.block_size})"
-            )
+            prefill_mode = "remotely"
         else:
             remote_prefill_params = None
+            prefill_mode = "locally"
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"Prefilling locally for request {request_id} with length {len(request.token_ids)} (estimated prefix hit length {(request.estimated_prefix_hit_num_blocks or 0) * self.engine_args.block_size})"
+                "Prefilling %s for request %s with length %d (estimated prefix hit length %d)",
+                prefill_mode,
+                request_id,
+                len(request.token_ids),
+                (request.estimated_prefix_hit_num_blocks or 0)
+                * self.engine_args.block_size,
             )
 
-        sampling_params = SamplingParams(**self.default_sampling_params)
-        sampling_params.output_kind = RequestOutputKind.DELTA
+        sampling_params = copy.copy(self._sampling_params_template)
         if request.sampling_options.temperature:
             sampling_params.temperature = request.sampling_options.temperature
         if request.sampling_options.top_p:
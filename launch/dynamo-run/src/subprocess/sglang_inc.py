@@ -6,6 +6,7 @@
 
 import argparse
 import asyncio
+import gc
 import json
 import logging
 import sys
@@ -52,13 +53,19 @@ class RequestHandler:
         self.engine_client = engine
 
     async def generate(self, request):
-        sampling_params = {}
-        if request["sampling_options"]["temperature"] is not None:
-            sampling_params["temperature"] = request["sampling_options"]["temperature"]
         sampling_params = {
             # sglang defaults this to 128
             "max_new_tokens": request["stop_conditions"]["max_tokens"],
         }
+        sampling_options = request["sampling_options"]
+        # 0 is a valid temperature (greedy)
+        if sampling_options.get("temperature") is not None:
+            sampling_params["temperature"] = sampling_options["temperature"]
+        # sglang rejects top_p/top_k of 0, so treat falsy as unset like VllmWorker
+        if sampling_options.get("top_p"):
+            sampling_params["top_p"] = sampling_options["top_p"]
+        if sampling_options.get("top_k"):
+            sampling_params["top_k"] = sampling_options["top_k"]
         num_output_tokens_so_far = 0
         gen = await self.engine_client.async_generate(
             input_ids=request["token_ids"], sampling_params=sampling_params, stream=True
@@ -69,11 +76,10 @@ class RequestHandler:
             finish_reason = res["meta_info"]["finish_reason"]
             if finish_reason:
                 # Don't forward the stop token
-                out = {"token_ids": [], "finish_reason": finish_reason["type"]}
-            else:
-                next_total_toks = len(res["output_ids"])
-                out = {"token_ids": res["output_ids"][num_output_tokens_so_far:]}
-            yield out
+                yield {"token_ids": [], "finish_reason": finish_reason["type"]}
+                break
+            next_total_toks = len(res["output_ids"])
+            yield {"token_ids": res["output_ids"][num_output_tokens_so_far:]}
             num_output_tokens_so_far = next_total_toks
 
 
@@ -170,6 +176,10 @@ async def init(runtime: DistributedRuntime, config: Config):
     )
     await register_llm(model_type, endpoint, config.model_path, config.model_name)
 
+    # Free startup garbage, then keep long-lived startup objects out of GC scans
+    gc.collect()
+    gc.freeze()
+
     # the server will gracefully shutdown (i.e., keep opened TCP streams finishes)
     # after the lease is revoked
     await endpoint.serve_endpoint(
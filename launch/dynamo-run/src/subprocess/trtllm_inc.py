@@ -18,10 +18,11 @@ import argparse
 import asyncio
 import base64
 import copy
+import gc
 import logging
 import sys
 import warnings
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from typing import Optional
 
 import uvloop
@@ -165,6 +166,10 @@ class RequestHandler:
         self.engine = config.engine
         self.component = config.component
         self.default_sampling_params = config.default_sampling_params
+        # Public SamplingParams attributes a request's sampling_options may override
+        self.sampling_param_keys = frozenset(
+            f.name for f in fields(SamplingParams) if not f.name.startswith("_")
+        )
         self.publisher = config.publisher
         self.disaggregation_mode = config.disaggregation_mode
         self.remote_prefill_client = config.remote_prefill_client
@@ -268,11 +273,10 @@ class RequestHandler:
             # Set the disaggregated params to generation_only for the rest of the generation
             disaggregated_params.request_type = "generation_only"
 
-        sampling_params = self.default_sampling_params
+        # Copy the defaults so concurrent requests don't overwrite each other's options
+        sampling_params = copy.copy(self.default_sampling_params)
         for key, value in request["sampling_options"].items():
-            if not value:
-                continue
-            if hasattr(sampling_params, key):
+            if value and key in self.sampling_param_keys:
                 setattr(sampling_params, key, value)
 
         max_tokens = request["stop_conditions"]["max_tokens"]
@@ -418,6 +422,10 @@ async def init(runtime: DistributedRuntime, config: Config):
             remote_prefill_client=remote_prefill_client,
         )
 
+        # Free startup garbage, then keep long-lived startup objects out of GC scans
+        gc.collect()
+        gc.freeze()
+
         if (
             config.publish_events_and_metrics
             and config.disaggregation_mode != "prefill"
@@ -254,6 +254,18 @@ class Client:
 
     ...
 
+    def instance_ids(self) -> List[int]:
+        """
+        Get list of current instance ids
+        """
+        ...
+
+    async def wait_for_instances(self) -> List[int]:
+        """
+        Wait for at least one instance of the endpoint to be available
+        """
+        ...
+
     async def random(self, request: JsonLike) -> AsyncIterator[JsonLike]:
         """
         Pick a random instance of the endpoint and issue the request